@@ -4,6 +4,7 @@ from scipy.interpolate import splev, splprep
 from numpy.ma import arange
 from shapely.geometry import LineString
 import json
+import itertools
 # Constants
 rounding_precision = 3
 interpolation_distance = 1
@@ -52,10 +53,8 @@ def _interpolate(the_test):
 
 
 def _incremental_id_generator():
-    test_id = 1
-    while True:
-        yield test_id
-        test_id += 1
+    # Unlike a generator function, itertools.count can be safely advanced by several threads
+    return itertools.count(1)
 
 
 class RoadTestFactory:
@@ -1,6 +1,4 @@
-import math
 import os
-import random
 import logging
 from typing import Optional
 
@@ -8,7 +6,6 @@ import numpy as np
 
 import gym
 from gym import spaces
-from gym.utils import seeding
 
 from code_pipeline.executors import MockExecutor
 from code_pipeline.tests_generation import RoadTestFactory
@@ -33,7 +30,7 @@ class RoadGenerationEnv(gym.Env):
              Episode length is greater than self.max_steps
         """
 
-    metadata = {"render.modes": ["human", "rgb_array"], "video.frames_per_second": 30}
+    metadata = {"render.modes": []}
 
     def __init__(self, executor, max_steps=1000, grid_size=200, results_folder="results", max_number_of_points=5,
                  max_reward=100, invalid_test_reward=-10):
@@ -47,6 +44,7 @@ class RoadGenerationEnv(gym.Env):
         self.max_reward = max_reward
         self.invalid_test_reward = invalid_test_reward
         self.failing_tests = []  # empty list of failing tests, to check for similarity with previously generated tests
+        self.rng = np.random.default_rng()  # own generator for each environment, see seed()
 
     def step(self, action):
         pass
@@ -54,72 +52,18 @@ class RoadGenerationEnv(gym.Env):
     def reset(self, seed: Optional[int] = None):
         pass
 
+    def seed(self, seed=None):
+        """
+        Seeds the random number generator of the environment, used to sample initial states.
+        """
+        self.rng = np.random.default_rng(seed)
+        return [seed]
+
     def render(self, mode="human"):
-        screen_width = 600
-        screen_height = 400
-
-        world_width = self.max_position - self.min_position
-        scale = screen_width / world_width
-        carwidth = 40
-        carheight = 20
-
-        if self.viewer is None:
-            from gym.envs.classic_control import rendering
-
-            self.viewer = rendering.Viewer(screen_width, screen_height)
-            xs = np.linspace(self.min_position, self.max_position, 100)
-            ys = self._height(xs)
-            xys = list(zip((xs - self.min_position) * scale, ys * scale))
-
-            self.track = rendering.make_polyline(xys)
-            self.track.set_linewidth(4)
-            self.viewer.add_geom(self.track)
-
-            clearance = 10
-
-            l, r, t, b = -carwidth / 2, carwidth / 2, carheight, 0
-            car = rendering.FilledPolygon([(l, b), (l, t), (r, t), (r, b)])
-            car.add_attr(rendering.Transform(translation=(0, clearance)))
-            self.cartrans = rendering.Transform()
-            car.add_attr(self.cartrans)
-            self.viewer.add_geom(car)
-            frontwheel = rendering.make_circle(carheight / 2.5)
-            frontwheel.set_color(0.5, 0.5, 0.5)
-            frontwheel.add_attr(
-                rendering.Transform(translation=(carwidth / 4, clearance))
-            )
-            frontwheel.add_attr(self.cartrans)
-            self.viewer.add_geom(frontwheel)
-            backwheel = rendering.make_circle(carheight / 2.5)
-            backwheel.add_attr(
-                rendering.Transform(translation=(-carwidth / 4, clearance))
-            )
-            backwheel.add_attr(self.cartrans)
-            backwheel.set_color(0.5, 0.5, 0.5)
-            self.viewer.add_geom(backwheel)
-            flagx = (self.goal_position - self.min_position) * scale
-            flagy1 = self._height(self.goal_position) * scale
-            flagy2 = flagy1 + 50
-            flagpole = rendering.Line((flagx, flagy1), (flagx, flagy2))
-            self.viewer.add_geom(flagpole)
-            flag = rendering.FilledPolygon(
-                [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)]
-            )
-            flag.set_color(0.8, 0.8, 0)
-            self.viewer.add_geom(flag)
-
-        pos = self.state[0]
-        self.cartrans.set_translation(
-            (pos - self.min_position) * scale, self._height(pos) * scale
-        )
-        self.cartrans.set_rotation(math.cos(3 * pos))
-
-        return self.viewer.render(return_rgb_array=mode == "rgb_array")
-
-    def close(self):
-        if self.viewer:
-            self.viewer.close()
-            self.viewer = None
+        """
+        Rendering is not supported: generated roads can be inspected with the road visualizer of the executor.
+        """
+        pass
 
     def get_road_points(self):
         """
@@ -134,7 +78,7 @@ class RoadGenerationEnv(gym.Env):
         execution_data = []
         max_oob_percentage = 0
         road_points = self.get_road_points()
-        logging.debug("Evaluating step. Current number of road points: %d (%s)", len(road_points), str(road_points))
+        logging.debug("Evaluating step. Current number of road points: %d (%s)", len(road_points), road_points)
 
         if len(road_points) < 3:  # cannot generate a good test (at most, a straight road with 2 points)
             logging.debug("Test with less than 3 points. Negative reward.")
@@ -147,7 +91,7 @@ class RoadGenerationEnv(gym.Env):
                 logging.debug("Test seems valid")
                 # we run the test in the simulator
                 test_outcome, description, execution_data = self.executor.execute_test(the_test)
-                logging.debug(f"Simulation results: {test_outcome}, {description}")
+                logging.debug("Simulation results: %s, %s", test_outcome, description)
                 if test_outcome == "ERROR":
                     # Could not simulate the test case. Probably the test is malformed test and evaded preliminary validation.
                     logging.debug("Test seemed valid, but test outcome was ERROR. Negative reward.")
@@ -156,15 +100,15 @@ class RoadGenerationEnv(gym.Env):
                     # Test is valid, and passed. Compute reward based on execution data
                     max_oob_percentage = self.get_max_oob_percentage(execution_data)
                     reward = self.compute_reward(max_oob_percentage)
-                    logging.debug(f"Test is valid and passed. Reward was {reward}, with {max_oob_percentage} OOB.")
+                    logging.debug("Test is valid and passed. Reward was %s, with %s OOB.", reward, max_oob_percentage)
                 elif test_outcome == "FAIL":
                     max_oob_percentage = self.get_max_oob_percentage(execution_data)
                     reward = self.max_reward
-                    logging.debug(f"Test is valid and failed. Reward was {reward}, with {max_oob_percentage} OOB.")
+                    logging.debug("Test is valid and failed. Reward was %s, with %s OOB.", reward, max_oob_percentage)
                     # save current test
                     self.failing_tests.append(the_test)
             else:
-                logging.debug(f"Test is invalid: {validation_message}")
+                logging.debug("Test is invalid: %s", validation_message)
         return reward, max_oob_percentage
 
     def compute_reward(self, max_oob_percentage):
@@ -0,0 +1,121 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from stable_baselines3.common.vec_env import VecEnv
+
+from road_generation_env_discrete import RoadGenerationDiscreteEnv
+
+
+class BatchedRoadGenerationEnv(VecEnv):
+    """
+    Vectorized version of RoadGenerationDiscreteEnv, with one road under construction per executor.
+
+    The states of all the roads are stacked in a single (num_envs, max_number_of_points, 2) array, so that the actions
+    of a step are checked and applied to all the roads at once. The roads changed by valid actions are then simulated
+    concurrently, each one with its own executor: step_async() starts the simulations and returns immediately, and
+    step_wait() collects their results.
+    Observations, rewards and actions are the same as in RoadGenerationDiscreteEnv, with a leading num_envs dimension.
+    Since simulations run in separate threads, executors should not share a simulator nor a (matplotlib) road
+    visualizer.
+    """
+
+    def __init__(self, executors, max_steps=1000, grid_size=200, results_folder="results", max_number_of_points=5,
+                 max_reward=100, invalid_test_reward=-10):
+
+        # one discrete environment per executor, reused for reward computation on its own slice of the states
+        self.envs = [RoadGenerationDiscreteEnv(executor, max_steps, grid_size, results_folder, max_number_of_points,
+                                               max_reward, invalid_test_reward) for executor in executors]
+        env = self.envs[0]
+        super().__init__(len(self.envs), env.observation_space, env.action_space)
+
+        self.max_steps = max_steps
+        self.max_number_of_points = max_number_of_points
+        self.invalid_test_reward = invalid_test_reward
+        self.discretization_precision = env.discretization_precision
+
+        self.states = np.zeros((self.num_envs, self.max_number_of_points, 2), dtype=np.int32)
+        for i, env in enumerate(self.envs):
+            env.state = self.states[i]  # view, changes to self.states are seen by the environment
+        self.step_counters = np.zeros(self.num_envs, dtype=np.int64)
+
+        self.simulations = []  # (index, future) pairs of the simulations started by the last step_async()
+        self.simulation_pool = ThreadPoolExecutor(max_workers=self.num_envs)
+
+    def reset(self):
+        self.states[:] = 0  # in place, to keep the views held by self.envs
+        self.step_counters[:] = 0
+        return self.get_observations(np.zeros(self.num_envs))
+
+    def step_async(self, actions):
+        actions = np.asarray(actions)
+        self.step_counters += 1
+
+        envs_range = np.arange(self.num_envs)
+        action_types = actions[:, 0]
+        positions = actions[:, 1]
+        xs = actions[:, 2]
+        ys = actions[:, 3]
+
+        # (num_envs, max_number_of_points) comparison of the new coordinates with the points of each road
+        coordinates_exist = ((self.states[:, :, 0] == xs[:, None]) & (self.states[:, :, 1] == ys[:, None])).any(axis=1)
+        point_exists = self.states[envs_range, positions].any(axis=1)
+
+        valid_add = (action_types == RoadGenerationDiscreteEnv.ADD_UPDATE) & ~coordinates_exist
+        valid_remove = (action_types == RoadGenerationDiscreteEnv.REMOVE) & point_exists
+        self.states[envs_range[valid_add], positions[valid_add]] = actions[valid_add, 2:]
+        self.states[envs_range[valid_remove], positions[valid_remove]] = 0
+
+        # only roads changed by valid actions are simulated, without waiting for the simulations to end: the caller
+        # can do other work (e.g., policy inference) until it calls step_wait()
+        changed = np.flatnonzero(valid_add | valid_remove)
+        logging.debug("Simulating %d of %d roads", len(changed), self.num_envs)
+        self.simulations = [(i, self.simulation_pool.submit(self.envs[i].compute_step)) for i in changed]
+
+    def step_wait(self):
+        # roads that were not simulated get the invalid test reward
+        rewards = np.full(self.num_envs, self.invalid_test_reward, dtype=np.float32)
+        max_oobs = np.zeros(self.num_envs)
+        for i, simulation in self.simulations:
+            rewards[i], max_oobs[i] = simulation.result()
+        self.simulations = []
+
+        dones = self.step_counters == self.max_steps
+        obs = self.get_observations(max_oobs)
+        infos = [{} for _ in range(self.num_envs)]
+        for i in np.flatnonzero(dones):
+            # as the other vectorized environments do, finished episodes are reset automatically
+            infos[i]["terminal_observation"] = obs[i].copy()
+            self.states[i] = 0
+            self.step_counters[i] = 0
+            obs[i] = 0.0
+        return obs, rewards, dones, infos
+
+    def get_observations(self, max_oobs):
+        obs = np.empty((self.num_envs, 2*self.max_number_of_points + 1), dtype=np.float32)
+        obs[:, :-1] = self.states.reshape(self.num_envs, -1)
+        obs[:, -1] = np.round(max_oobs*100*self.discretization_precision)  # max_oob in [0,1] becomes 0..1000
+        return obs
+
+    def close(self):
+        self.simulation_pool.shutdown()
+        for env in self.envs:
+            env.close()
+
+    def seed(self, seed=None):
+        # as the other vectorized environments do, each environment gets its own seed
+        return [env.seed(None if seed is None else seed + i)[0] for i, env in enumerate(self.envs)]
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self.envs[i], attr_name) for i in self._get_indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        for i in self._get_indices(indices):
+            setattr(self.envs[i], attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return [getattr(self.envs[i], method_name)(*method_args, **method_kwargs) for i in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
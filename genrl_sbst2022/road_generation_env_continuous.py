@@ -1,6 +1,5 @@
 import math
 import os
-import random
 import logging
 from typing import Optional
 
@@ -8,7 +7,6 @@ import numpy as np
 
 import gym
 from gym import spaces
-from gym.utils import seeding
 
 from code_pipeline.executors import MockExecutor
 from code_pipeline.tests_generation import RoadTestFactory
@@ -59,18 +57,14 @@ class RoadGenerationContinuousEnv(RoadGenerationEnv):
         self.min_oob_percentage = 0.0
         self.max_oob_percentage = 1.0
 
-        # state is an empty sequence of points
-        self.state = np.empty(self.max_number_of_points, dtype=object)
-        for i in range(self.max_number_of_points):
-            self.state[i] = (0, 0)  # (0,0) represents absence of information in the i-th cell
+        # state is an empty sequence of points, (0,0) represents absence of information in the i-th cell
+        self.state = np.zeros((self.max_number_of_points, 2))
 
         self.low_coordinates = np.array([self.min_coordinate, self.min_coordinate], dtype=np.float16)
         self.high_coordinates = np.array([self.max_coordinate, self.max_coordinate], dtype=np.float16)
         self.low_observation = np.array([], dtype=np.float16)
         self.high_observation = np.array([], dtype=np.float16)
 
-        self.viewer = None
-
         # action space as a box
         self.action_space = spaces.Box(
             low=np.array([0.0, 0.0, self.min_coordinate + 0.1, self.min_coordinate + 0.1]),
@@ -88,6 +82,9 @@ class RoadGenerationContinuousEnv(RoadGenerationEnv):
 
         self.observation_space = spaces.Box(self.low_observation, self.high_observation, dtype=np.float16)
 
+        # observation buffer, filled in place at each step instead of being reallocated
+        self._obs_buf = np.zeros(2*self.max_number_of_points + 1, dtype=np.float16)
+
     def step(self, action):
         assert self.action_space.contains(
             action
@@ -100,8 +97,6 @@ class RoadGenerationContinuousEnv(RoadGenerationEnv):
         x = action[2]  # coordinate in [self.min_coordinate,self.max_coordinate]
         y = action[3]  # coordinate in [self.min_coordinate,self.max_coordinate]
 
-        logging.info(f"Processing action {str(action)}")
-
         if action_type == self.ADD_UPDATE and not self.check_coordinates_already_exist(x, y):
             logging.debug("Setting coordinates for point %d to (%.2f, %.2f)", position, x, y)
             self.state[position] = (x, y)
@@ -123,20 +118,19 @@ class RoadGenerationContinuousEnv(RoadGenerationEnv):
         done = self.step_counter == self.max_steps
 
         # return observation, reward, done, info
-        obs = [coordinate for tuple in self.state for coordinate in tuple]
-        obs.append(max_oob)
-        return np.array(obs, dtype=np.float16), reward, done, {}
+        self._obs_buf[:-1] = self.state.ravel()
+        self._obs_buf[-1] = max_oob
+        return self._obs_buf.copy(), reward, done, {}  # copy, callers may hold on to previous observations
 
     def reset(self, seed: Optional[int] = None):
-        # super().reset(seed=seed)
+        if seed is not None:
+            self.seed(seed)
         # state is an empty sequence of points
-        self.state = np.empty(self.max_number_of_points, dtype=object)
-        for i in range(self.max_number_of_points):
-            self.state[i] = (0, 0)  # (0,0) represents absence of information in the i-th cell
+        self.state = np.zeros((self.max_number_of_points, 2))
         # return observation
-        obs = [coordinate for tuple in self.state for coordinate in tuple]
-        obs.append(0.0)  # zero oob initially
-        return np.array(obs, dtype=np.float16)
+        self._obs_buf[:-1] = self.state.ravel()
+        self._obs_buf[-1] = 0.0  # zero oob initially
+        return self._obs_buf.copy()
 
 
     def get_road_points(self):
@@ -1,6 +1,5 @@
 import math
 import os
-import random
 import logging
 from typing import Optional
 
@@ -8,7 +7,6 @@ import numpy as np
 
 import gym
 from gym import spaces
-from gym.utils import seeding
 
 from code_pipeline.executors import MockExecutor
 from code_pipeline.tests_generation import RoadTestFactory
@@ -20,7 +18,7 @@ from road_generation_env import RoadGenerationEnv
 class RoadGenerationDiscreteEnv(RoadGenerationEnv):
     """
     Observation:
-            Type: MultiDiscrete(2n+1) where n is self.max_number_of_points
+            Type: Box(2n+1) where n is self.max_number_of_points, holding discrete values
 
             Num     Observation             Min                 Max
             0       x coord for 1st point   self.min_coord      self.max_coord
@@ -59,12 +57,9 @@ class RoadGenerationDiscreteEnv(RoadGenerationEnv):
         self.min_oob_percentage = 0
         self.max_oob_percentage = 100
 
-        # state is an empty sequence of points
-        self.state = np.empty(self.max_number_of_points, dtype=object)
-        for i in range(self.max_number_of_points):
-            self.state[i] = (0, 0)  # (0,0) represents absence of information in the i-th cell
-
-        self.viewer = None
+        # state is an empty sequence of points, stored as a (max_number_of_points, 2) array of discrete coordinates
+        self.state = np.zeros((self.max_number_of_points, 2), dtype=np.int32)  # (0,0) represents absence of
+        # information in the i-th cell
 
         self.discretization_precision = 10
         self.map_buffer_area_width = self.grid_size / 20  # size of the area around the map in which we do not generate
@@ -72,81 +67,93 @@ class RoadGenerationDiscreteEnv(RoadGenerationEnv):
         number_of_discrete_coords_in_map = self.grid_size * self.discretization_precision
         width_of_buffer_area = self.map_buffer_area_width * self.discretization_precision
         number_of_discrete_coords = number_of_discrete_coords_in_map - 2*width_of_buffer_area
+        self._oob_scale = 100 * self.discretization_precision  # maps max oob in [0,1] to its discrete value
 
         self.action_space = spaces.MultiDiscrete([2, self.max_number_of_points, number_of_discrete_coords,
                                                   number_of_discrete_coords])
+        # raw action bounds, checked in step() without going through MultiDiscrete.contains()
+        self._action_low = np.zeros_like(self.action_space.nvec)
+        self._action_high = self.action_space.nvec.copy()
 
         # create box observation space
         discretized_oob_size = self.max_oob_percentage * self.discretization_precision
         dimensions_list = [number_of_discrete_coords] * (2*max_number_of_points)  # two coords for each point
         dimensions_list.append(discretized_oob_size)
-        self.observation_space = spaces.MultiDiscrete(dimensions_list)
+        # same bounds as MultiDiscrete(dimensions_list), but as a Box of the dtype actually returned by step()
+        self.observation_space = spaces.Box(low=np.zeros(len(dimensions_list), dtype=np.float32),
+                                            high=np.array(dimensions_list, dtype=np.float32) - 1, dtype=np.float32)
+
+        # observation buffer, filled in place at each step instead of being reallocated
+        self._obs_buf = np.zeros(2*self.max_number_of_points + 1, dtype=np.float32)
+        self._obs_dirty = True  # whether the state changed since the coordinates were last copied into the buffer
 
     def step(self, action):
-        assert self.action_space.contains(
-            action
+        assert np.all(
+            (self._action_low <= action) & (action < self._action_high)
         ), f"{action!r} ({type(action)}) invalid"
 
-        self.step_counter = self.step_counter + 1  # increment step counter
-
-        action_type = action[0]  # value in [0,1]
-        position = action[1]  # value in [0,self.number_of_points-1]
-        x = action[2]  # coordinate
-        y = action[3]  # coordinate
-
-        logging.info(f"Processing action {str(action)}")
-
-        reward = 0
-
-        if action_type == self.ADD_UPDATE and not self.check_coordinates_already_exist(x, y):
-            logging.debug("Setting coordinates for point %d to (%.2f, %.2f)", position, x, y)
-            self.state[position] = (x, y)
-            reward, max_oob = self.compute_step()
-        elif action_type == self.ADD_UPDATE and self.check_coordinates_already_exist(x, y):
-            logging.debug("Skipping add of (%.2f, %.2f) in position %d. Coordinates already exist", x, y, position)
-            reward = self.invalid_test_reward
-            max_oob = 0.0
-        elif action_type == self.REMOVE and self.check_some_coordinates_exist_at_position(position):
-            logging.debug("Removing coordinates for point %d", position)
-            self.state[position] = (0, 0)
-            reward, max_oob = self.compute_step()
-        elif action_type == self.REMOVE and not self.check_some_coordinates_exist_at_position(position):
-            # disincentive deleting points where already there is no point
-            logging.debug(f"Skipping delete at position {position}. No point there.")
-            reward = self.invalid_test_reward
-            max_oob = 0.0
+        self.step_counter += 1  # increment step counter
+
+        # action type in [0,1], position in [0,self.number_of_points-1], x and y coordinates
+        action_type, position, x, y = action
+
+        if action_type == self.ADD_UPDATE:
+            if not self.check_coordinates_already_exist(x, y):
+                logging.debug("Setting coordinates for point %d to (%d, %d)", position, x, y)
+                self.state[position] = (x, y)
+                self._obs_dirty = True
+                reward, max_oob = self.compute_step()
+            else:
+                logging.debug("Skipping add of (%d, %d) in position %d. Coordinates already exist", x, y, position)
+                reward = self.invalid_test_reward
+                max_oob = 0.0
+        else:  # action_type == self.REMOVE
+            if self.check_some_coordinates_exist_at_position(position):
+                logging.debug("Removing coordinates for point %d", position)
+                self.state[position] = (0, 0)
+                self._obs_dirty = True
+                reward, max_oob = self.compute_step()
+            else:
+                # disincentive deleting points where already there is no point
+                logging.debug("Skipping delete at position %d. No point there.", position)
+                reward = self.invalid_test_reward
+                max_oob = 0.0
 
         done = self.step_counter == self.max_steps
 
         # return observation, reward, done, info
-        obs = self.get_state_observation()
-        obs.append(round(max_oob*100*self.discretization_precision))  # max_oob is in [0,1], we make it in 0..1000
-        return np.array(obs, dtype=np.float16), reward, done, {}
+        obs_buf = self._obs_buf
+        if self._obs_dirty:  # invalid actions leave the state, and thus the coordinates in the buffer, untouched
+            obs_buf[:-1] = self.get_state_observation()
+            self._obs_dirty = False
+        obs_buf[-1] = round(max_oob*self._oob_scale)  # max_oob in [0,1] becomes 0..1000
+        return obs_buf.copy(), reward, done, {}  # copy, callers may hold on to previous observations
 
     def get_state_observation(self):
-        obs = [coordinate for tuple in self.state for coordinate in tuple]
-        return obs
+        # flat view (x1, y1, x2, y2, ...) of the state, no copy involved
+        return self.state.ravel()
 
     def reset(self, seed: Optional[int] = None):
-        # super().reset(seed=seed)
+        if seed is not None:
+            self.seed(seed)
         # state is an empty sequence of points
-        self.state = np.empty(self.max_number_of_points, dtype=object)
-        for i in range(self.max_number_of_points):
-            self.state[i] = (0, 0)  # (0,0) represents absence of information in the i-th cell
+        self.state = np.zeros((self.max_number_of_points, 2), dtype=np.int32)
         # return observation
-        obs = self.get_state_observation()
-        obs.append(0.0)  # zero oob initially
-        return np.array(obs, dtype=np.float16)
+        self._obs_buf[:-1] = self.get_state_observation()
+        self._obs_dirty = False
+        self._obs_buf[-1] = 0.0  # zero oob initially
+        return self._obs_buf.copy()
 
     def get_road_points(self):
-        road_points = []  # np.array([], dtype=object)
-        for i in range(self.max_number_of_points):
-            if self.state[i][0] != 0 and self.state[i][1] != 0:
-                road_points.append(
-                    (
-                        (self.state[i][0] + self.map_buffer_area_width) / self.discretization_precision,
-                        (self.state[i][1] + self.map_buffer_area_width) / self.discretization_precision
-                    )
-                )
-        logging.debug(f"Current road points: {str(road_points)}")
+        # points with both coordinates set, in the order in which they appear in the state
+        points = (self.state[self.state.all(axis=1)] + self.map_buffer_area_width) / self.discretization_precision
+        road_points = [tuple(point) for point in points.tolist()]  # RoadTest expects a list of (x, y) pairs
+        logging.debug("Current road points: %s", road_points)
         return road_points
+
+    def check_some_coordinates_exist_at_position(self, position):
+        return bool(self.state[position].any())
+
+    def check_coordinates_already_exist(self, x, y):
+        # for a handful of points a list lookup is cheaper than dispatching NumPy comparisons
+        return [x, y] in self.state.tolist()
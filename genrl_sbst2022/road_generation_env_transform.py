@@ -1,6 +1,5 @@
 import math
 import os
-import random
 import logging
 from typing import Optional
 from collections import deque
@@ -9,7 +8,6 @@ import numpy as np
 
 import gym
 from gym import spaces
-from gym.utils import seeding
 
 from code_pipeline.executors import MockExecutor
 from code_pipeline.tests_generation import RoadTestFactory
@@ -71,12 +69,10 @@ class RoadGenerationTransformationEnv(RoadGenerationEnv):
         self.state = np.empty(self.max_number_of_points, dtype=object)
         for i in range(self.max_number_of_points):
             self.state[i] = (
-                random.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
-                random.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
             )
 
-        self.viewer = None
-
         # create box observation space
         for i in range(self.max_number_of_points):
             self.low_observation = np.append(self.low_observation, [0.0, 0.0])
@@ -86,6 +82,9 @@ class RoadGenerationTransformationEnv(RoadGenerationEnv):
 
         self.observation_space = spaces.Box(self.low_observation, self.high_observation, dtype=np.float16)
 
+        # observation buffer, filled in place at each step instead of being reallocated
+        self._obs_buf = np.zeros(2*self.max_number_of_points + 1, dtype=np.float16)
+
         # create action space
         self.action_space = spaces.MultiDiscrete([4, self.max_number_of_points, 3])
         self.change_amounts = [0.025, 0.05, 0.25]  # corresponding to 5, 10 points on the map
@@ -103,8 +102,6 @@ class RoadGenerationTransformationEnv(RoadGenerationEnv):
         position = action[1]  # value in [0,self.number_of_points-1]
         amount = action[2]  # value in [0,2] for small, medium, high amounts of movement
 
-        logging.info(f"Processing action {str(action)}")
-
         self.state[position], is_valid = self.process_action(action_type, position, amount)
 
         done = False
@@ -122,21 +119,22 @@ class RoadGenerationTransformationEnv(RoadGenerationEnv):
             done = True
 
         # return observation, reward, done, info
-        obs = self.get_state_observation()
-        obs.append(max_oob)  # append oob to state observation to get the complete observation
-        return np.array(obs, dtype=np.float16), reward, done, {}
+        self._obs_buf[:-1] = self.get_state_observation()
+        self._obs_buf[-1] = max_oob  # append oob to state observation to get the complete observation
+        return self._obs_buf.copy(), reward, done, {}  # copy, callers may hold on to previous observations
 
     def get_state_observation(self):
         obs = [coordinate for tuple in self.state for coordinate in tuple]
         return obs
 
     def reset(self, seed: Optional[int] = None):
-        # super().reset(seed=seed)
+        if seed is not None:
+            self.seed(seed)
         self.reset_state()
         # return observation
-        obs = self.get_state_observation()
-        obs.append(0.0)  # zero oob initially
-        return np.array(obs, dtype=np.float16)
+        self._obs_buf[:-1] = self.get_state_observation()
+        self._obs_buf[-1] = 0.0  # zero oob initially
+        return self._obs_buf.copy()
 
     def get_road_points(self):
         road_points = []
@@ -187,32 +185,34 @@ class RoadGenerationTransformationEnv(RoadGenerationEnv):
         logging.info("Resetting state")
         if self.max_number_of_points != 4:
             self.state = np.empty(self.max_number_of_points, dtype=object)
+            min_admissible_coord = self.min_coordinate + self.safety_buffer
+            max_admissible_coord = self.max_coordinate - self.safety_buffer
             for i in range(self.max_number_of_points):
                 self.state[i] = (
-                    random.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
-                    random.uniform(self.min_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
+                    self.rng.uniform(min_admissible_coord, max_admissible_coord),
+                    self.rng.uniform(min_admissible_coord, max_admissible_coord)
                 )
         else:
             # if we have exactly four points, generate one of them in each quadrant (to reduce initially invalid roads)
             # TODO: we should generalize this (both to work with any number of points)
             point_q1 = (
-                random.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
-                random.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
+                self.rng.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
+                self.rng.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
             )
             point_q2 = (
-                random.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer),
-                random.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer),
+                self.rng.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer)
             )
             point_q3 = (
-                random.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer),
-                random.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer)
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer),
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer)
             )
             point_q4 = (
-                random.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
-                random.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer)
+                self.rng.uniform(self.mid_coordinate + self.safety_buffer, self.max_coordinate - self.safety_buffer),
+                self.rng.uniform(self.min_coordinate + self.safety_buffer, self.mid_coordinate - self.safety_buffer)
             )
             d = deque([point_q1, point_q2, point_q3, point_q4])
-            if random.choice([True, False]):
+            if self.rng.random() < 0.5:
                 d.reverse()  # make the points go "clockwise"
-            d.rotate(random.randint(0, 3))  # optionally shift the starting point
+            d.rotate(int(self.rng.integers(0, 4)))  # optionally shift the starting point
             self.state = np.array(d, dtype=object)  # convert deque to np array